@@ -0,0 +1,85 @@
+"""
+Numba-JIT kernels for linear search
+-----------------------------------
+Concept:
+- The generic Python loop in `01_linear_search.py` pays bytecode dispatch
+  (~50ns) per element. Numba compiles the same loop to native code via
+  LLVM, which auto-vectorizes the comparison, so scanning a contiguous
+  int64/float64 ndarray runs at near-C speed.
+
+Design notes:
+- Each kernel returns -1 for "not found" instead of None so that its
+  signature stays monomorphic (Numba unions of int/None are slow).
+  The caller translates -1 back to None at the boundary.
+- Kernels are warmed at import time with a 1-element call so the one-off
+  JIT compilation cost is not paid on the first real search.
+- This module is optional: if Numba is not installed, `search` is None
+  and callers fall back to their own paths.
+"""
+
+from __future__ import annotations
+from typing import Optional
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:  # Numba (or NumPy) not installed; kernels unavailable.
+    np = None
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True, boundscheck=False)
+    def _search_i64(arr, target):
+        """Scan an int64 array; return the first match index or -1."""
+        for i in range(arr.shape[0]):
+            if arr[i] == target:
+                return i
+        return -1
+
+    @njit(cache=True, boundscheck=False)
+    def _search_f64(arr, target):
+        """Scan a float64 array; return the first match index or -1."""
+        for i in range(arr.shape[0]):
+            if arr[i] == target:
+                return i
+        return -1
+
+    def search(arr: "np.ndarray", target) -> Optional[int]:
+        """
+        Dispatch to the JIT kernel matching `arr.dtype`.
+
+        Returns the index of the first match, None if the target is not
+        present, or None if no kernel exists for this dtype (so the caller
+        can fall back to a generic scan).
+        """
+        if arr.ndim != 1:
+            return None
+        if isinstance(target, bool):
+            # bool is an int subclass and compares equal to 0/1; pass the
+            # equivalent int so Numba does not type it as a boolean.
+            target = int(target)
+        elif not isinstance(target, (int, float, np.integer, np.floating)):
+            # A non-numeric target would raise TypingError inside the JIT
+            # kernel; report "no kernel" so the caller falls back.
+            return None
+        if arr.dtype == np.int64:
+            if isinstance(target, (int, np.integer)) and not (
+                -(1 << 63) <= int(target) < (1 << 63)
+            ):
+                # Unrepresentable as int64, so no element can equal it
+                # (feeding it to the kernel would raise OverflowError).
+                return None
+            index = _search_i64(arr, target)
+        elif arr.dtype == np.float64:
+            index = _search_f64(arr, target)
+        else:
+            return None
+        return index if index >= 0 else None
+
+    # Warm the JIT cache so the first real call does not pay compile time.
+    _search_i64(np.zeros(1, dtype=np.int64), 0)
+    _search_f64(np.zeros(1, dtype=np.float64), 0.0)
+else:
+    search = None
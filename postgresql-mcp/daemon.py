@@ -0,0 +1,100 @@
+"""
+Long-lived MCP daemon serving the PostgreSQL server over a UNIX socket.
+
+The stdio transport spawns a fresh Python process per client session,
+paying interpreter startup, imports (pydantic, asyncpg, openai, ...) and
+pool warmup every time — hundreds of milliseconds before the first query
+runs. Running the server behind a UNIX-domain socket amortizes all of
+that across clients: connecting costs one socket handshake and every
+session shares the warm connection pool and caches.
+
+Usage:
+    python daemon.py --socket /tmp/pgmcp.sock
+
+Clients connect with: python mcp_client.py --socket /tmp/pgmcp.sock <command>
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+import structlog
+
+from postgresql_mcp.db_pool import db_pool
+from postgresql_mcp.socket_transport import socket_streams
+
+# Importing mcp_server reuses its Server instance, tool handlers, caches
+# and logging configuration (stderr, JSON).
+from mcp_server import server
+
+logger = structlog.get_logger(__name__)
+
+
+async def handle_client(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Run one MCP session for a connected client."""
+    peer = writer.get_extra_info("peername") or "unix-client"
+    logger.info("Client connected", peer=str(peer))
+    try:
+        async with socket_streams(reader, writer) as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                server.create_initialization_options()
+            )
+    except Exception as e:
+        logger.warning("Client session ended with error", error=str(e))
+    finally:
+        logger.info("Client disconnected", peer=str(peer))
+
+
+async def main():
+    """Main entry point for the daemon."""
+    parser = argparse.ArgumentParser(
+        description="PostgreSQL MCP daemon - persistent server over a UNIX socket"
+    )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default="/tmp/pgmcp.sock",
+        help="Path of the UNIX socket to listen on (default: /tmp/pgmcp.sock)"
+    )
+    args = parser.parse_args()
+
+    # Initialize database pool once for all client sessions
+    logger.info("Initializing database connection pool")
+    await db_pool.initialize()
+
+    if not await db_pool.health_check():
+        logger.error("Database health check failed")
+        sys.exit(1)
+
+    # Remove a stale socket from a previous run
+    try:
+        os.unlink(args.socket)
+    except FileNotFoundError:
+        pass
+
+    unix_server = await asyncio.start_unix_server(handle_client, path=args.socket)
+    logger.info("Daemon listening", socket=args.socket)
+
+    try:
+        async with unix_server:
+            await unix_server.serve_forever()
+    finally:
+        await db_pool.close()
+        try:
+            os.unlink(args.socket)
+        except FileNotFoundError:
+            pass
+
+
+if __name__ == "__main__":
+    try:
+        # libuv's C event loop cuts per-syscall dispatch overhead for the
+        # many-small-IO pattern of MCP framing + asyncpg.
+        import uvloop
+        uvloop.install()
+    except ImportError:  # uvloop is optional; fall back to stock asyncio.
+        pass
+    asyncio.run(main())
@@ -4,15 +4,19 @@ Provides a command-line interface for natural language database queries.
 """
 
 import asyncio
-import json
+import io
 import sys
 import argparse
+from contextlib import AsyncExitStack
 from typing import Any, Optional
 import structlog
 
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+from postgresql_mcp import jsonx
+from postgresql_mcp.socket_transport import unix_socket_client
+
 # Configure logging
 structlog.configure(
     processors=[
@@ -25,154 +29,247 @@ logger = structlog.get_logger(__name__)
 
 
 class PostgreSQLMCPClient:
-    """Client for interacting with PostgreSQL MCP Server."""
-    
-    def __init__(self, server_command: list[str]):
+    """
+    Client for interacting with PostgreSQL MCP Server.
+
+    Can be used as an async context manager to keep one server subprocess
+    and one initialized MCP session alive across calls:
+
+        async with PostgreSQLMCPClient(["python", "mcp_server.py"]) as client:
+            await client.list_tables()
+            await client.describe_table("users")
+
+    Outside a context manager, each call spawns a fresh server process
+    (one-shot mode), which is significantly slower for multi-call workflows.
+
+    When `socket_path` is given, the client connects to an already-running
+    daemon (see daemon.py) over a UNIX socket instead of spawning a server
+    subprocess, skipping interpreter startup and pool warmup entirely.
+    """
+
+    def __init__(
+        self,
+        server_command: Optional[list[str]] = None,
+        socket_path: Optional[str] = None,
+    ):
         """
         Initialize the MCP client.
-        
+
         Args:
             server_command: Command to start the MCP server (e.g., ["python", "mcp_server.py"])
+            socket_path: UNIX socket of a running daemon; takes precedence
+                over spawning `server_command`
+        """
+        if server_command is None and socket_path is None:
+            raise ValueError("Either server_command or socket_path is required")
+
+        self.socket_path = socket_path
+        self.server_params = None
+        if server_command is not None:
+            self.server_params = StdioServerParameters(
+                command=server_command[0],
+                args=server_command[1:] if len(server_command) > 1 else [],
+                env=None
+            )
+        self._session: Optional[ClientSession] = None
+        self._stack: Optional[AsyncExitStack] = None
+
+    async def __aenter__(self) -> "PostgreSQLMCPClient":
+        """Open a persistent session (daemon socket or server subprocess)."""
+        self._stack = AsyncExitStack()
+        try:
+            if self.socket_path is not None:
+                read, write = await self._stack.enter_async_context(
+                    unix_socket_client(self.socket_path)
+                )
+            else:
+                read, write = await self._stack.enter_async_context(
+                    stdio_client(self.server_params)
+                )
+            self._session = await self._stack.enter_async_context(
+                ClientSession(read, write)
+            )
+            await self._session.initialize()
+        except BaseException:
+            await self._stack.aclose()
+            self._session = None
+            self._stack = None
+            raise
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Tear down the persistent session and server subprocess."""
+        try:
+            await self._stack.aclose()
+        finally:
+            self._session = None
+            self._stack = None
+
+    @staticmethod
+    def _parse_tool_result(result: Any) -> dict[str, Any]:
+        """Extract the JSON payload from a tool call result."""
+        if result.content:
+            content = result.content[0]
+            if hasattr(content, 'text'):
+                return jsonx.loads(content.text)
+        return {"error": "No result received"}
+
+    async def _with_session(self, op):
         """
-        self.server_params = StdioServerParameters(
-            command=server_command[0],
-            args=server_command[1:] if len(server_command) > 1 else [],
-            env=None
+        Run `op(session)` on the persistent session, or on a one-shot one.
+
+        Single place that owns transport setup: when no persistent session
+        is open, an AsyncExitStack spins up the stdio transport and session
+        for just this call.
+        """
+        if self._session is not None:
+            return await op(self._session)
+
+        if self.server_params is None:
+            raise RuntimeError(
+                "One-shot calls need a server command; socket clients must "
+                "be used as an async context manager"
+            )
+
+        async with AsyncExitStack() as stack:
+            read, write = await stack.enter_async_context(
+                stdio_client(self.server_params)
+            )
+            session = await stack.enter_async_context(ClientSession(read, write))
+            await session.initialize()
+            return await op(session)
+
+    async def _call(self, tool: str, args: dict[str, Any]) -> dict[str, Any]:
+        """Invoke a tool and parse its JSON payload."""
+        result = await self._with_session(
+            lambda session: session.call_tool(tool, arguments=args)
         )
-    
+        return self._parse_tool_result(result)
+
     async def natural_language_query(self, question: str) -> dict[str, Any]:
         """
         Execute a natural language query.
-        
+
         Args:
             question: Natural language question about the database
-            
+
         Returns:
             Query results as dictionary
         """
-        async with stdio_client(self.server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                result = await session.call_tool(
-                    "natural_language_query",
-                    arguments={"question": question}
-                )
-                
-                if result.content:
-                    content = result.content[0]
-                    if hasattr(content, 'text'):
-                        return json.loads(content.text)
-        
-        return {"error": "No result received"}
-    
+        return await self._call("natural_language_query", {"question": question})
+
     async def sql_query(self, query: str) -> dict[str, Any]:
         """
         Execute a SQL query directly.
-        
+
         Args:
             query: SQL SELECT query
-            
+
         Returns:
             Query results as dictionary
         """
-        async with stdio_client(self.server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                result = await session.call_tool(
-                    "query_database",
-                    arguments={"query": query}
-                )
-                
-                if result.content:
-                    content = result.content[0]
-                    if hasattr(content, 'text'):
-                        return json.loads(content.text)
-        
-        return {"error": "No result received"}
-    
+        return await self._call("query_database", {"query": query})
+
     async def list_tables(self) -> dict[str, Any]:
         """List all tables in the database."""
-        async with stdio_client(self.server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                result = await session.call_tool("list_tables", arguments={})
-                
-                if result.content:
-                    content = result.content[0]
-                    if hasattr(content, 'text'):
-                        return json.loads(content.text)
-        
-        return {"error": "No result received"}
-    
+        return await self._call("list_tables", {})
+
     async def describe_table(self, table_name: str) -> dict[str, Any]:
         """
         Get schema information for a table.
-        
+
         Args:
             table_name: Name of the table to describe
-            
+
         Returns:
             Table schema information
         """
-        async with stdio_client(self.server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                result = await session.call_tool(
+        return await self._call("describe_table", {"table_name": table_name})
+
+    async def describe_tables(
+        self, names: list[str], max_concurrency: int = 16
+    ) -> dict[str, Any]:
+        """
+        Describe several tables concurrently over the shared session.
+
+        Issues the describe_table calls with asyncio.gather so the per-call
+        round-trip latency overlaps instead of adding up. Concurrency is
+        bounded so a long table list cannot pipeline unbounded work into
+        the server's database pool.
+
+        Args:
+            names: Table names to describe
+            max_concurrency: Maximum number of in-flight calls
+
+        Returns:
+            Mapping of table name to its schema information
+        """
+        if self._session is None:
+            raise RuntimeError(
+                "describe_tables requires a persistent session; "
+                "use 'async with PostgreSQLMCPClient(...)'"
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def describe(name: str) -> dict[str, Any]:
+            async with semaphore:
+                result = await self._session.call_tool(
                     "describe_table",
-                    arguments={"table_name": table_name}
+                    arguments={"table_name": name}
                 )
-                
-                if result.content:
-                    content = result.content[0]
-                    if hasattr(content, 'text'):
-                        return json.loads(content.text)
-        
-        return {"error": "No result received"}
-    
+                return self._parse_tool_result(result)
+
+        results = await asyncio.gather(*(describe(name) for name in names))
+        return dict(zip(names, results))
+
+    @staticmethod
+    def _format_resources(result: Any) -> list[dict[str, Any]]:
+        """Convert a list_resources result into plain dictionaries."""
+        return [
+            {
+                "uri": resource.uri,
+                "name": resource.name,
+                "description": resource.description or "",
+                "mimeType": resource.mimeType or ""
+            }
+            for resource in result.resources
+        ]
+
     async def list_resources(self) -> list[dict[str, Any]]:
         """List available database resources."""
-        async with stdio_client(self.server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                result = await session.list_resources()
-                
-                return [
-                    {
-                        "uri": resource.uri,
-                        "name": resource.name,
-                        "description": resource.description or "",
-                        "mimeType": resource.mimeType or ""
-                    }
-                    for resource in result.resources
-                ]
+        result = await self._with_session(
+            lambda session: session.list_resources()
+        )
+        return self._format_resources(result)
 
 
 def print_results(results: dict[str, Any], format_output: str = "json"):
     """Print query results in specified format."""
     if format_output == "json":
-        print(json.dumps(results, indent=2, default=str))
+        print(jsonx.dumps(results, indent=2, default=str))
     elif format_output == "table" and "data" in results:
         data = results["data"]
         if not data:
             print("No results found.")
             return
-        
-        # Print header
+
+        # Buffer the whole table and flush it with a single write: one
+        # print per row means one GIL acquisition and one syscall each,
+        # which dominates for wide result sets.
         headers = list(data[0].keys())
-        print(" | ".join(headers))
-        print("-" * (sum(len(h) for h in headers) + 3 * len(headers)))
-        
-        # Print rows
+        buf = io.StringIO()
+        buf.write(" | ".join(headers))
+        buf.write("\n")
+        buf.write("-" * (sum(len(h) for h in headers) + 3 * len(headers)))
+        buf.write("\n")
         for row in data:
-            values = [str(row.get(h, "")) for h in headers]
-            print(" | ".join(values))
+            get = row.get  # local binding avoids attribute lookup per row
+            buf.write(" | ".join(str(get(h, "")) for h in headers))
+            buf.write("\n")
+        sys.stdout.write(buf.getvalue())
     else:
-        print(json.dumps(results, indent=2, default=str))
+        print(jsonx.dumps(results, indent=2, default=str))
 
 
 async def main():
@@ -193,6 +290,13 @@ async def main():
         default=["mcp_server.py"],
         help="Arguments for the server command (default: mcp_server.py)"
     )
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="UNIX socket of a running daemon (see daemon.py); "
+             "skips spawning a server subprocess"
+    )
     
     subparsers = parser.add_subparsers(dest="command", help="Command to execute")
     
@@ -222,6 +326,9 @@ async def main():
     # Describe table
     describe_parser = subparsers.add_parser("describe", help="Describe table schema")
     describe_parser.add_argument("table_name", help="Name of the table")
+
+    # Describe all tables
+    subparsers.add_parser("describe-all", help="Describe every table concurrently")
     
     # List resources
     subparsers.add_parser("resources", help="List available resources")
@@ -232,26 +339,33 @@ async def main():
         parser.print_help()
         sys.exit(1)
     
-    # Create client
+    # Create client; the context manager keeps one server session alive
+    # for the duration of the command. With --socket the client talks to
+    # a long-lived daemon instead of spawning a server subprocess.
     server_command = [args.server] + (args.server_args if args.server_args else [])
-    client = PostgreSQLMCPClient(server_command)
-    
+
     try:
-        if args.command == "query":
-            results = await client.natural_language_query(args.question)
-            print_results(results, args.format)
-        elif args.command == "sql":
-            results = await client.sql_query(args.query)
-            print_results(results, args.format)
-        elif args.command == "tables":
-            results = await client.list_tables()
-            print_results(results)
-        elif args.command == "describe":
-            results = await client.describe_table(args.table_name)
-            print_results(results)
-        elif args.command == "resources":
-            results = await client.list_resources()
-            print(json.dumps(results, indent=2))
+        async with PostgreSQLMCPClient(server_command, socket_path=args.socket) as client:
+            if args.command == "query":
+                results = await client.natural_language_query(args.question)
+                print_results(results, args.format)
+            elif args.command == "sql":
+                results = await client.sql_query(args.query)
+                print_results(results, args.format)
+            elif args.command == "tables":
+                results = await client.list_tables()
+                print_results(results)
+            elif args.command == "describe":
+                results = await client.describe_table(args.table_name)
+                print_results(results)
+            elif args.command == "describe-all":
+                tables = await client.list_tables()
+                names = [t["table_name"] for t in tables.get("tables", [])]
+                results = await client.describe_tables(names)
+                print_results(results)
+            elif args.command == "resources":
+                results = await client.list_resources()
+                print(jsonx.dumps(results, indent=2))
     except Exception as e:
         logger.error("Error executing command", error=str(e), error_type=type(e).__name__)
         print(f"Error: {e}", file=sys.stderr)
@@ -259,5 +373,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        # libuv's C event loop cuts per-syscall dispatch overhead for the
+        # many-small-IO pattern of MCP framing + asyncpg.
+        import uvloop
+        uvloop.install()
+    except ImportError:  # uvloop is optional; fall back to stock asyncio.
+        pass
     asyncio.run(main())
 
@@ -4,9 +4,11 @@ Provides natural language to SQL conversion and read-only query execution.
 """
 
 import asyncio
-import json
+import contextlib
+import functools
 import sys
 from typing import Any, Sequence
+import asyncpg
 import structlog
 
 from mcp.server import Server
@@ -19,10 +21,12 @@ from mcp.types import (
     EmbeddedResource,
 )
 
+from postgresql_mcp import jsonx
 from postgresql_mcp.config import settings
 from postgresql_mcp.db_pool import db_pool
 from postgresql_mcp.sql_validator import SQLValidator
 from postgresql_mcp.nl_to_sql import nl_to_sql_converter
+from postgresql_mcp.schema_cache import TTLCache
 
 # Configure structured logging to stderr (stdout is used for MCP protocol)
 import sys
@@ -39,6 +43,73 @@ logger = structlog.get_logger(__name__)
 # Create MCP server instance
 server = Server("postgresql-mcp")
 
+# Schema introspection results change rarely; serve repeats from memory.
+# User-data queries (query_database / natural_language_query) stay uncached.
+schema_cache = TTLCache(ttl=30.0)
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_cached(query: str) -> tuple[bool, str | None]:
+    """Memoized read-only validation.
+
+    Validation is a pure function of the query text, and clients (and
+    LLMs) frequently resubmit identical queries; an LRU on the exact
+    string skips the regex work entirely on repeats.
+    """
+    return SQLValidator.validate_read_only(query)
+
+
+async def _fetch_capped(query: str) -> tuple[list[asyncpg.Record], bool]:
+    """Collect rows for a user query via a server-side cursor, up to the cap.
+
+    An MCP tool result is a single TextContent blob, so the rows must be
+    assembled in memory here; streaming through the cursor keeps the
+    driver from buffering the whole result set and lets the scan stop as
+    soon as the configured row cap is reached.
+    """
+    rows: list[asyncpg.Record] = []
+    # aclosing: stopping at the cap abandons the generator mid-iteration,
+    # and without an explicit aclose() the transaction and pooled
+    # connection inside iter_rows would only be released whenever the GC
+    # finalizes it — concurrent capped queries could drain the pool.
+    async with contextlib.aclosing(db_pool.iter_rows(query)) as records:
+        async for record in records:
+            rows.append(record)
+            if len(rows) >= settings.query_max_rows:
+                return rows, True
+    return rows, False
+
+
+# Below this row count the response is encoded inline: thread dispatch
+# overhead would exceed the encode time for small payloads.
+_ENCODE_OFFLOAD_THRESHOLD = 100
+
+
+async def _encode_payload(payload: dict[str, Any], row_count: int) -> str:
+    """Encode a tool response without stalling the event loop.
+
+    Encoding a wide result set can take tens of milliseconds, during
+    which a synchronous dumps would block every other connection. Large
+    payloads are encoded in a worker thread; orjson releases the GIL in
+    its C encoder, so other tasks genuinely run in parallel.
+    """
+    if row_count < _ENCODE_OFFLOAD_THRESHOLD:
+        return jsonx.dumps(payload, indent=2, default=_json_default)
+    return await asyncio.to_thread(
+        jsonx.dumps, payload, indent=2, default=_json_default
+    )
+
+
+def _json_default(obj: Any) -> Any:
+    """JSON fallback encoder: serialize asyncpg rows in place, stringify the rest.
+
+    Handling Record here lets query results flow from the pool to the JSON
+    output without building an intermediate list of dicts per response.
+    """
+    if isinstance(obj, asyncpg.Record):
+        return dict(obj)
+    return str(obj)
+
 
 @server.list_resources()
 async def list_resources() -> list[Resource]:
@@ -52,7 +123,10 @@ async def list_resources() -> list[Resource]:
             AND table_type = 'BASE TABLE'
             ORDER BY table_name;
         """
-        tables = await db_pool.fetch(tables_query)
+        tables = await schema_cache.get_or_set(
+            ("list_resources",),
+            lambda: db_pool.fetch_prepared(tables_query),
+        )
         
         resources = [
             Resource(
@@ -90,7 +164,10 @@ async def read_resource(uri: str) -> list[TextContent]:
             WHERE table_schema = 'public' AND table_name = $1
             ORDER BY ordinal_position;
         """
-        columns = await db_pool.fetch(columns_query, table_name)
+        columns = await schema_cache.get_or_set(
+            ("read_resource", table_name),
+            lambda: db_pool.fetch_prepared(columns_query, table_name),
+        )
         
         schema_info = {
             "table": table_name,
@@ -107,7 +184,7 @@ async def read_resource(uri: str) -> list[TextContent]:
         
         return [TextContent(
             type="text",
-            text=json.dumps(schema_info, indent=2)
+            text=jsonx.dumps(schema_info, indent=2)
         )]
     except Exception as e:
         logger.error("Error reading resource", uri=uri, error=str(e))
@@ -188,35 +265,35 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
             if not query:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": "Query parameter is required"}, indent=2)
+                    text=jsonx.dumps({"error": "Query parameter is required"}, indent=2)
                 )]
             
-            # Validate query
-            is_valid, error_msg = SQLValidator.validate_read_only(query)
+            # Validate query (memoized on the exact query text)
+            is_valid, error_msg = _validate_cached(query)
             if not is_valid:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": error_msg}, indent=2)
+                    text=jsonx.dumps({"error": error_msg}, indent=2)
                 )]
             
-            # Execute query
-            results = await db_pool.fetch(query)
+            # Execute query (streamed from a cursor, capped at query_max_rows)
+            results, truncated = await _fetch_capped(query)
             
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "row_count": len(results),
-                    "data": results
-                }, indent=2, default=str)
-            )]
+            text = await _encode_payload({
+                "success": True,
+                "row_count": len(results),
+                "truncated": truncated,
+                "data": results
+            }, len(results))
+            
+            return [TextContent(type="text", text=text)]
         
         elif name == "natural_language_query":
             question = arguments.get("question")
             if not question:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": "Question parameter is required"}, indent=2)
+                    text=jsonx.dumps({"error": "Question parameter is required"}, indent=2)
                 )]
             
             # Convert natural language to SQL
@@ -225,7 +302,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
             if conversion_result["error"]:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({
+                    text=jsonx.dumps({
                         "success": False,
                         "error": conversion_result["error"],
                         "question": question
@@ -234,42 +311,48 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
             
             sql_query = conversion_result["sql"]
             
-            # Execute the SQL query
-            results = await db_pool.fetch(sql_query)
+            # Execute the SQL query (streamed from a cursor, capped at query_max_rows)
+            results, truncated = await _fetch_capped(sql_query)
             
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "success": True,
-                    "question": question,
-                    "sql": sql_query,
-                    "explanation": conversion_result["explanation"],
-                    "row_count": len(results),
-                    "data": results
-                }, indent=2, default=str)
-            )]
+            text = await _encode_payload({
+                "success": True,
+                "question": question,
+                "sql": sql_query,
+                "explanation": conversion_result["explanation"],
+                "row_count": len(results),
+                "truncated": truncated,
+                "data": results
+            }, len(results))
+            
+            return [TextContent(type="text", text=text)]
         
         elif name == "list_tables":
+            # Single GROUP BY instead of a correlated COUNT(*) subquery,
+            # which re-scanned information_schema.columns once per table.
             tables_query = """
-                SELECT 
-                    table_name,
-                    (SELECT COUNT(*) 
-                     FROM information_schema.columns 
-                     WHERE table_schema = 'public' 
-                     AND table_name = t.table_name) as column_count
+                SELECT
+                    t.table_name,
+                    COUNT(c.column_name) AS column_count
                 FROM information_schema.tables t
-                WHERE table_schema = 'public' 
-                AND table_type = 'BASE TABLE'
-                ORDER BY table_name;
+                LEFT JOIN information_schema.columns c
+                    ON c.table_schema = t.table_schema
+                    AND c.table_name = t.table_name
+                WHERE t.table_schema = 'public'
+                AND t.table_type = 'BASE TABLE'
+                GROUP BY t.table_name
+                ORDER BY t.table_name;
             """
-            tables = await db_pool.fetch(tables_query)
+            tables = await schema_cache.get_or_set(
+                ("list_tables",),
+                lambda: db_pool.fetch_prepared(tables_query),
+            )
             
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=jsonx.dumps({
                     "success": True,
                     "tables": tables
-                }, indent=2)
+                }, indent=2, default=_json_default)
             )]
         
         elif name == "describe_table":
@@ -277,7 +360,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
             if not table_name:
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": "table_name parameter is required"}, indent=2)
+                    text=jsonx.dumps({"error": "table_name parameter is required"}, indent=2)
                 )]
             
             columns_query = """
@@ -291,28 +374,31 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent |
                 WHERE table_schema = 'public' AND table_name = $1
                 ORDER BY ordinal_position;
             """
-            columns = await db_pool.fetch(columns_query, table_name)
+            columns = await schema_cache.get_or_set(
+                ("describe_table", table_name),
+                lambda: db_pool.fetch_prepared(columns_query, table_name),
+            )
             
             return [TextContent(
                 type="text",
-                text=json.dumps({
+                text=jsonx.dumps({
                     "success": True,
                     "table": table_name,
                     "columns": columns
-                }, indent=2)
+                }, indent=2, default=_json_default)
             )]
         
         else:
             return [TextContent(
                 type="text",
-                text=json.dumps({"error": f"Unknown tool: {name}"}, indent=2)
+                text=jsonx.dumps({"error": f"Unknown tool: {name}"}, indent=2)
             )]
     
     except Exception as e:
         logger.error("Error executing tool", tool=name, error=str(e), error_type=type(e).__name__)
         return [TextContent(
             type="text",
-            text=json.dumps({
+            text=jsonx.dumps({
                 "success": False,
                 "error": str(e),
                 "error_type": type(e).__name__
@@ -343,5 +429,12 @@ async def main():
 
 
 if __name__ == "__main__":
+    try:
+        # libuv's C event loop cuts per-syscall dispatch overhead for the
+        # many-small-IO pattern of MCP framing + asyncpg.
+        import uvloop
+        uvloop.install()
+    except ImportError:  # uvloop is optional; fall back to stock asyncio.
+        pass
     asyncio.run(main())
 
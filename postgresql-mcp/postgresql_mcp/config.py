@@ -27,9 +27,18 @@ class Settings(BaseSettings):
     # OpenAI Configuration
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
     openai_model: str = Field(default="gpt-4o-mini", alias="OPENAI_MODEL")
+    # Seconds the NL-to-SQL converter reuses its schema snapshot before
+    # re-reading the catalog
+    schema_cache_ttl: float = Field(default=300.0, alias="SCHEMA_CACHE_TTL")
+    # Maximum simultaneous in-flight OpenAI completion calls; excess
+    # callers queue instead of tripping API rate limits.
+    openai_max_concurrency: int = Field(default=16, alias="OPENAI_MAX_CONCURRENCY")
     
     # Server Configuration
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
+    # Safety cap on rows returned by a single query tool call; results
+    # beyond this are dropped and the response is marked truncated.
+    query_max_rows: int = Field(default=10000, alias="QUERY_MAX_ROWS")
     
     class Config:
         env_file = ".env"
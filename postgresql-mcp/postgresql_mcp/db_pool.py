@@ -3,6 +3,7 @@ PostgreSQL connection pool manager for scalable database access.
 Implements connection pooling for efficient resource management.
 """
 
+import asyncio
 import asyncpg
 from typing import Optional
 import structlog
@@ -15,23 +16,39 @@ logger = structlog.get_logger(__name__)
 
 class DatabasePool:
     """Manages PostgreSQL connection pool with automatic lifecycle management."""
-    
+
     def __init__(self):
         self._pool: Optional[asyncpg.Pool] = None
         self._dsn = settings.postgres_dsn
     
+    @staticmethod
+    async def _init_connection(conn: asyncpg.Connection) -> None:
+        """Set session parameters on every new pool connection.
+
+        PG JIT never pays off for the tiny catalog queries this server
+        issues but adds planning overhead to each one; the statement
+        timeout bounds runaway user queries.
+        """
+        await conn.execute("SET jit = off; SET statement_timeout = '30s';")
+
     async def initialize(self) -> None:
-        """Initialize the connection pool."""
+        """Initialize the connection pool and warm it up."""
         if self._pool is not None:
             logger.warning("Pool already initialized")
             return
-        
+
         try:
             self._pool = await asyncpg.create_pool(
                 self._dsn,
                 min_size=settings.postgres_min_pool_size,
                 max_size=settings.postgres_max_pool_size,
                 command_timeout=60,
+                init=self._init_connection,
+            )
+            # Warm-up: ping min_size connections concurrently so the first
+            # real queries do not each pay TLS handshake + auth latency.
+            await asyncio.gather(
+                *(self.health_check() for _ in range(settings.postgres_min_pool_size))
             )
             logger.info(
                 "Database pool initialized",
@@ -58,35 +75,86 @@ class DatabasePool:
         async with self._pool.acquire() as connection:
             yield connection
     
-    async def fetch(self, query: str, *args) -> list[dict]:
+    async def fetch(self, query: str, *args) -> list[asyncpg.Record]:
         """
-        Execute a SELECT query and return results as list of dictionaries.
-        
+        Execute a SELECT query and return the result rows.
+
+        Rows are returned as asyncpg.Record objects, which support both
+        index and column-name access like a read-only dict. Returning them
+        directly avoids building a throwaway dict per row; callers that
+        serialize to JSON handle Record at the encoder boundary instead.
+
         Args:
             query: SQL query string
             *args: Query parameters
-            
+
         Returns:
-            List of dictionaries representing rows
+            List of Record objects representing rows
         """
         async with self.acquire() as conn:
-            rows = await conn.fetch(query, *args)
-            return [dict(row) for row in rows]
+            return await conn.fetch(query, *args)
     
-    async def fetch_one(self, query: str, *args) -> Optional[dict]:
+    async def fetch_prepared(self, query: str, *args) -> list[asyncpg.Record]:
         """
-        Execute a SELECT query and return first result as dictionary.
-        
+        Execute a hot, fixed-text SELECT query (e.g. schema introspection).
+
+        Statement reuse is left to asyncpg's built-in per-connection
+        statement cache (statement_cache_size=100 by default), which
+        transparently prepares the query text once per connection and
+        skips the server-side parse/analyze/plan step on repeats. Holding
+        PreparedStatement objects across pool acquires does not work:
+        their methods are guarded against the connection having been
+        released back to the pool and raise InterfaceError on reuse.
+
         Args:
             query: SQL query string
             *args: Query parameters
-            
+
+        Returns:
+            List of Record objects representing rows
+        """
+        return await self.fetch(query, *args)
+
+    async def iter_rows(self, query: str, *args, prefetch: int = 1000):
+        """
+        Execute a SELECT query and yield rows from a server-side cursor.
+
+        Unlike fetch(), the full result set is never materialized by the
+        driver: rows arrive in batches of `prefetch`, so peak memory is
+        bounded by the batch size and consumers can stop early (e.g. at a
+        row cap) without transferring the rest of the result.
+
+        Args:
+            query: SQL query string
+            *args: Query parameters
+            prefetch: Number of rows fetched from the server per batch
+
+        Yields:
+            Record objects, one per row
+        """
+        async with self.acquire() as conn:
+            # Cursors require an enclosing transaction in asyncpg.
+            async with conn.transaction():
+                async for record in conn.cursor(query, *args, prefetch=prefetch):
+                    yield record
+
+    async def fetch_one(self, query: str, *args) -> Optional[asyncpg.Record]:
+        """
+        Execute a SELECT query and return the first result row.
+
+        Like fetch(), the row is returned as an asyncpg.Record: column
+        names are hashed once per result set by the driver, not re-hashed
+        per row as a dict copy would.
+
+        Args:
+            query: SQL query string
+            *args: Query parameters
+
         Returns:
-            Dictionary representing the first row, or None if no results
+            Record representing the first row, or None if no results
         """
         async with self.acquire() as conn:
-            row = await conn.fetchrow(query, *args)
-            return dict(row) if row else None
+            return await conn.fetchrow(query, *args)
     
     async def execute(self, query: str, *args) -> str:
         """
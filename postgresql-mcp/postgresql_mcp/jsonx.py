@@ -0,0 +1,45 @@
+"""
+JSON encode/decode helpers with an optional orjson fast path.
+orjson is a C extension roughly 5-10x faster than the stdlib encoder
+(stdlib's indent path in particular runs a pure-Python pretty-printer);
+when it is not installed we fall back to the stdlib with identical
+call signatures.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional dependency; stdlib json is the fallback.
+    orjson = None
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: Optional[int] = None,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> str:
+    """
+    Serialize `obj` to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: If truthy, pretty-print (orjson supports 2-space indent)
+        default: Fallback callable for otherwise unserializable objects
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option, default=default).decode("utf-8")
+    return json.dumps(obj, indent=indent, default=default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string or bytes payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
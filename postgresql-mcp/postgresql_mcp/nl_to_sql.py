@@ -3,10 +3,14 @@ Natural Language to SQL conversion module.
 Uses OpenAI API to convert natural language queries to SQL.
 """
 
+import asyncio
+import json
+import time
 from typing import Optional, Dict, Any
 import re
+import httpx
 import structlog
-from openai import OpenAI
+from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletion
 
 from postgresql_mcp.config import settings
@@ -15,54 +19,222 @@ from postgresql_mcp.sql_validator import SQLValidator
 
 logger = structlog.get_logger(__name__)
 
+# NL-to-SQL result cache bounds: entries expire after an hour and the
+# cache is capped so a stream of unique questions cannot grow it forever.
+_RESULT_CACHE_TTL = 3600.0
+_RESULT_CACHE_MAX = 1024
+
+# Precompiled pieces of the cache-key skeleton.
+_SKELETON_PUNCT_RE = re.compile(r'[^\w\s]')
+_SKELETON_WS_RE = re.compile(r'\s+')
+
 
 class NLToSQLConverter:
     """Converts natural language queries to SQL using OpenAI."""
     
     def __init__(self):
-        self.client: Optional[OpenAI] = None
+        self.client: Optional[AsyncOpenAI] = None
         if settings.openai_api_key:
-            self.client = OpenAI(api_key=settings.openai_api_key)
+            # Async client: the completion call awaits instead of blocking
+            # the event loop (and every concurrent request) for its full
+            # duration, matching the async design of db_pool.
+            #
+            # Explicit httpx transport: the SDK default caps keepalive
+            # connections low for bursty workloads, and HTTP/2 multiplexes
+            # concurrent completions over one TCP+TLS connection, keeping
+            # handshakes off the per-request path.
+            self.client = AsyncOpenAI(
+                api_key=settings.openai_api_key,
+                max_retries=2,
+                http_client=httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=64,
+                        max_keepalive_connections=32,
+                    ),
+                    timeout=httpx.Timeout(30.0, connect=5.0),
+                    http2=True,
+                ),
+            )
         else:
             logger.warning("OpenAI API key not provided. NL to SQL conversion will be limited.")
-    
-    async def get_schema_info(self) -> str:
-        """Get database schema information to help with SQL generation."""
-        try:
-            # Get table names
-            tables_query = """
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'public' 
-                AND table_type = 'BASE TABLE'
-                ORDER BY table_name;
-            """
-            tables = await db_pool.fetch(tables_query)
-            table_names = [t['table_name'] for t in tables]
-            
-            if not table_names:
-                return "No tables found in the database."
-            
-            # Get columns for each table
-            schema_info = []
-            for table_name in table_names[:10]:  # Limit to first 10 tables for performance
-                columns_query = """
-                    SELECT column_name, data_type, is_nullable
-                    FROM information_schema.columns
-                    WHERE table_schema = 'public' AND table_name = $1
-                    ORDER BY ordinal_position;
-                """
-                columns = await db_pool.fetch(columns_query, table_name)
-                column_info = [
-                    f"  {col['column_name']} ({col['data_type']})"
-                    for col in columns
-                ]
-                schema_info.append(f"Table: {table_name}\n" + "\n".join(column_info))
-            
-            return "\n\n".join(schema_info)
-        except Exception as e:
-            logger.error("Failed to get schema info", error=str(e))
-            return "Unable to retrieve schema information."
+        # Cached (timestamp, per-table entries) pair; schemas change
+        # rarely, so convert_to_sql should not pay catalog round-trips per
+        # call. Each entry is (table_name, match tokens, formatted block).
+        self._schema_cache: Optional[tuple[float, list[tuple[str, frozenset, str]]]] = None
+        # Version stamp of the cached entries; when the TTL lapses a cheap
+        # probe compares stamps and only a real schema change triggers the
+        # full catalog refetch.
+        self._schema_stamp: Optional[tuple] = None
+        self._schema_lock = asyncio.Lock()
+        # Successful conversions keyed by query skeleton; a hit skips the
+        # LLM call entirely (seconds and tokens down to a dict lookup).
+        self._result_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._result_lock = asyncio.Lock()
+        # Bound on simultaneous completion calls; excess callers queue
+        # here instead of tripping OpenAI rate limits under burst load.
+        self._sem = asyncio.Semaphore(settings.openai_max_concurrency)
+        # In-flight conversions by skeleton key: duplicate questions that
+        # arrive while one is running await its future instead of issuing
+        # their own LLM call.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def _skeleton(natural_language_query: str) -> str:
+        """Normalize a question into its cache key.
+
+        Lowercases, strips punctuation and collapses whitespace, so
+        rephrasings like \"How many users?\" and \"how many users\" share an
+        entry. Literals (numbers, names) are deliberately kept: the cached
+        SQL embeds them, so keying them away would return stale values.
+        """
+        key = _SKELETON_PUNCT_RE.sub(' ', natural_language_query.lower())
+        return _SKELETON_WS_RE.sub(' ', key).strip()
+
+    async def get_schema_info(self, question: Optional[str] = None) -> str:
+        """Get database schema information to help with SQL generation.
+
+        Served from an in-process cache for settings.schema_cache_ttl
+        seconds; a lock makes concurrent cache misses refresh once instead
+        of stampeding the catalog. Errors are returned but never cached.
+
+        When `question` is given, only the tables most relevant to it are
+        included (see _select_relevant), shrinking the prompt on wide
+        schemas; with no question the full snapshot is returned.
+        """
+        cached = self._schema_cache
+        if cached is None or time.monotonic() - cached[0] >= settings.schema_cache_ttl:
+            async with self._schema_lock:
+                # Re-check: another waiter may have refreshed while we queued.
+                cached = self._schema_cache
+                if cached is None or time.monotonic() - cached[0] >= settings.schema_cache_ttl:
+                    try:
+                        stamp = await self._schema_version_stamp()
+                        if cached is not None and stamp == self._schema_stamp:
+                            # Unchanged: renew the TTL, skip the full refetch.
+                            cached = (time.monotonic(), cached[1])
+                        else:
+                            entries = await self._fetch_schema_entries()
+                            cached = (time.monotonic(), entries)
+                            self._schema_stamp = stamp
+                    except Exception as e:
+                        logger.error("Failed to get schema info", error=str(e))
+                        return "Unable to retrieve schema information."
+                    self._schema_cache = cached
+
+        entries = cached[1]
+        if not entries:
+            return "No tables found in the database."
+
+        if question is not None:
+            entries = self._select_relevant(entries, question)
+
+        # Blocks are single lines, so one newline per table suffices.
+        return "\n".join(block for _, _, block in entries)
+
+    @staticmethod
+    def _select_relevant(
+        entries: list[tuple[str, frozenset, str]],
+        question: str,
+        top_k: int = 3,
+    ) -> list[tuple[str, frozenset, str]]:
+        """Pick the tables most relevant to `question` by token overlap.
+
+        Scores each table by how many question words appear among its
+        name/column tokens and keeps the top_k scorers. If nothing
+        overlaps (cold start, vague question), the full schema is returned
+        so the model is never starved of context.
+        """
+        question_tokens = {
+            tok for tok in _SKELETON_WS_RE.split(
+                _SKELETON_PUNCT_RE.sub(' ', question.lower())
+            ) if tok
+        }
+        scored = [
+            (len(question_tokens & tokens), index, entry)
+            for index, (entry, tokens) in enumerate(
+                (entry, entry[1]) for entry in entries
+            )
+        ]
+        top = sorted(
+            (item for item in scored if item[0] > 0),
+            key=lambda item: (-item[0], item[1]),
+        )[:top_k]
+        if not top:
+            return entries
+        # Preserve catalog order in the prompt for stable output.
+        return [entry for _, _, entry in sorted(top, key=lambda item: item[1])]
+
+    @staticmethod
+    async def _schema_version_stamp() -> tuple:
+        """Cheap change probe for the public schema.
+
+        Table count, newest relation oid and total column count together
+        move whenever a table is created, dropped or gains a column, so
+        an unchanged stamp means the cached entries are still valid.
+        """
+        rows = await db_pool.fetch_prepared("""
+            SELECT count(*) AS tables, max(oid) AS newest, sum(relnatts) AS columns
+            FROM pg_class
+            WHERE relnamespace = 'public'::regnamespace AND relkind = 'r';
+        """)
+        row = rows[0]
+        return (row['tables'], row['newest'], row['columns'])
+
+    async def _fetch_schema_entries(self) -> list[tuple[str, frozenset, str]]:
+        """Read the schema from the catalog and format it for the prompt."""
+        # Tables and columns in one round-trip, straight from pg_class /
+        # pg_attribute: one ordered scan instead of the two-query
+        # information_schema view stack (which joins several catalogs per
+        # row behind the scenes).
+        columns_query = """
+            SELECT c.relname AS table_name,
+                   a.attname AS column_name,
+                   format_type(a.atttypid, a.atttypmod) AS data_type,
+                   NOT a.attnotnull AS is_nullable
+            FROM pg_class c
+            JOIN pg_attribute a ON a.attrelid = c.oid
+            WHERE c.relkind = 'r'
+              AND c.relnamespace = 'public'::regnamespace
+              AND a.attnum > 0
+              AND NOT a.attisdropped
+            ORDER BY c.relname, a.attnum;
+        """
+        # Fixed-text query: fetch_prepared leans on asyncpg's built-in
+        # per-connection statement cache, skipping the server-side
+        # parse/plan after the first call on each pooled connection.
+        columns = await db_pool.fetch_prepared(columns_query)
+
+        columns_by_table: Dict[str, list] = {}
+        for col in columns:
+            columns_by_table.setdefault(col['table_name'], []).append(col)
+
+        if not columns_by_table:
+            return []
+
+        # Limit to first 10 tables for performance
+        table_names = list(columns_by_table)[:10]
+
+        entries = []
+        for table_name in table_names:
+            table_columns = columns_by_table.get(table_name, [])
+            # Compact one-line form, e.g. users(id:integer, name:text?)
+            # with '?' marking nullable columns: the verbose indented
+            # layout spent a large share of its prompt tokens on
+            # whitespace and boilerplate.
+            column_info = [
+                f"{col['column_name']}:{col['data_type']}"
+                + ("?" if col['is_nullable'] else "")
+                for col in table_columns
+            ]
+            block = f"{table_name}({', '.join(column_info)})"
+            # Match tokens: table and column names split on underscores,
+            # so "user_id" matches questions mentioning "user" or "id".
+            tokens = set(table_name.lower().split('_'))
+            for col in table_columns:
+                tokens.update(col['column_name'].lower().split('_'))
+            entries.append((table_name, frozenset(tokens), block))
+
+        return entries
     
     async def convert_to_sql(self, natural_language_query: str) -> Dict[str, Any]:
         """
@@ -80,10 +252,50 @@ class NLToSQLConverter:
                 'error': 'OpenAI API key not configured',
                 'explanation': None
             }
-        
+
+        cache_key = self._skeleton(natural_language_query)
+        async with self._result_lock:
+            entry = self._result_cache.get(cache_key)
+            if entry is not None:
+                if time.monotonic() - entry[0] < _RESULT_CACHE_TTL:
+                    logger.info(
+                        "NL to SQL cache hit",
+                        query_preview=natural_language_query[:100]
+                    )
+                    return entry[1]
+                del self._result_cache[cache_key]
+            inflight = self._inflight.get(cache_key)
+            if inflight is None:
+                future: asyncio.Future = asyncio.get_running_loop().create_future()
+                self._inflight[cache_key] = future
+
+        if inflight is not None:
+            # Same question already being converted: piggyback on it.
+            logger.info(
+                "NL to SQL coalesced with in-flight call",
+                query_preview=natural_language_query[:100]
+            )
+            return await inflight
+
         try:
-            # Get schema information
-            schema_info = await self.get_schema_info()
+            result = await self._convert_uncached(natural_language_query, cache_key)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                # Owner was cancelled mid-call; wake any piggybacked waiters.
+                future.cancel()
+            async with self._result_lock:
+                self._inflight.pop(cache_key, None)
+
+    async def _convert_uncached(
+        self, natural_language_query: str, cache_key: str
+    ) -> Dict[str, Any]:
+        """Run one real conversion (schema fetch, LLM call, validation)."""
+        try:
+            # Get schema information (sliced to the tables relevant to
+            # this question to keep prompt tokens down)
+            schema_info = await self.get_schema_info(question=natural_language_query)
             
             # Create prompt for OpenAI
             system_prompt = """You are a SQL expert that converts natural language questions into PostgreSQL SELECT queries.
@@ -96,10 +308,10 @@ Rules:
 5. Make queries efficient and use appropriate JOINs when needed
 6. Return only the SQL query, no explanations in the query itself
 
-Database Schema:
+Database Schema (one table per line as table(column:type, ...); '?' marks nullable columns):
 {schema_info}
 
-Return the SQL query only, without markdown formatting or code blocks."""
+Respond with a JSON object of the form {{"sql": "<the query>"}}."""
             
             user_prompt = f"Convert this natural language question to a PostgreSQL SELECT query:\n\n{natural_language_query}"
             
@@ -109,20 +321,46 @@ Return the SQL query only, without markdown formatting or code blocks."""
             ]
             
             logger.info("Converting NL to SQL", query_preview=natural_language_query[:100])
-            
-            response: ChatCompletion = self.client.chat.completions.create(
-                model=settings.openai_model,
-                messages=messages,
-                temperature=0.1,  # Lower temperature for more consistent SQL generation
-                max_tokens=500,
-            )
-            
-            sql_query = response.choices[0].message.content.strip()
-            
-            # Remove markdown code blocks if present
-            sql_query = re.sub(r'```sql\n?', '', sql_query)
-            sql_query = re.sub(r'```\n?', '', sql_query)
-            sql_query = sql_query.strip()
+
+            async with self._sem:
+                response: ChatCompletion = await self.client.chat.completions.create(
+                    model=settings.openai_model,
+                    messages=messages,
+                    temperature=0.1,  # Lower temperature for more consistent SQL generation
+                    max_tokens=256,  # SELECT-only output is short; smaller cap, lower latency
+                    # Structured output: the schema constrains the reply to
+                    # {"sql": ...}, so no markdown fences to scrub off.
+                    response_format={
+                        "type": "json_schema",
+                        "json_schema": {
+                            "name": "sql_out",
+                            "schema": {
+                                "type": "object",
+                                "properties": {"sql": {"type": "string"}},
+                                "required": ["sql"],
+                                "additionalProperties": False,
+                            },
+                        },
+                    },
+                )
+
+            content = response.choices[0].message.content.strip()
+            try:
+                sql_query = json.loads(content)['sql'].strip()
+            except (ValueError, KeyError, TypeError, AttributeError):
+                # Model ignored the schema (or it is unsupported by the
+                # configured model); fall back to treating the reply as raw
+                # SQL and strip markdown fences if present. TypeError covers
+                # valid JSON that is not an object (a bare string or list),
+                # where the subscript itself fails.
+                sql_query = content
+                if sql_query.startswith('```sql'):
+                    sql_query = sql_query[6:].lstrip('\n')
+                elif sql_query.startswith('```'):
+                    sql_query = sql_query[3:].lstrip('\n')
+                if sql_query.endswith('```'):
+                    sql_query = sql_query[:-3].rstrip()
+                sql_query = sql_query.strip()
             
             # Validate the generated SQL
             is_valid, error_msg = SQLValidator.validate_read_only(sql_query)
@@ -140,13 +378,22 @@ Return the SQL query only, without markdown formatting or code blocks."""
                 }
             
             logger.info("Successfully converted NL to SQL", sql_preview=sql_query[:100])
-            
-            return {
+
+            result = {
                 'sql': sql_query,
                 'error': None,
                 'explanation': f"Converted '{natural_language_query}' to SQL query"
             }
-            
+
+            # Only successful conversions are cached; errors should retry.
+            async with self._result_lock:
+                if len(self._result_cache) >= _RESULT_CACHE_MAX:
+                    # Evict the oldest entry (dicts keep insertion order).
+                    self._result_cache.pop(next(iter(self._result_cache)))
+                self._result_cache[cache_key] = (time.monotonic(), result)
+
+            return result
+
         except Exception as e:
             logger.error("Error converting NL to SQL", error=str(e), error_type=type(e).__name__)
             return {
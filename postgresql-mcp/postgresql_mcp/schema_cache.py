@@ -0,0 +1,74 @@
+"""
+In-process TTL cache for schema introspection results.
+Database schemas change rarely, so introspection queries can be served
+from memory for a short window instead of hitting the catalog each call.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """Async-safe cache with a fixed time-to-live per entry."""
+
+    def __init__(self, ttl: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid after being stored
+        """
+        self._ttl = ttl
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def _get_fresh(self, key: Hashable) -> Optional[tuple[float, Any]]:
+        """Return the cache entry for `key` if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._ttl:
+            return entry
+        return None
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        coro_factory: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return the cached value for `key`, computing it on miss.
+
+        A per-key lock serializes concurrent misses so only one caller
+        runs `coro_factory` (no refresh stampede); the rest get the
+        freshly stored value. Errors from the factory propagate and leave
+        the cache entry unset.
+
+        Args:
+            key: Hashable cache key
+            coro_factory: Zero-argument callable returning an awaitable
+                that produces the value
+
+        Returns:
+            The cached or freshly computed value
+        """
+        entry = self._get_fresh(key)
+        if entry is not None:
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check: another waiter may have refreshed while we queued.
+            entry = self._get_fresh(key)
+            if entry is not None:
+                return entry[1]
+
+            value = await coro_factory()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or the whole cache when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
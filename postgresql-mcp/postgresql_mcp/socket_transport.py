@@ -0,0 +1,110 @@
+"""
+UNIX-domain-socket transport for MCP sessions.
+
+The stdio transport ties one server process to one client session: every
+client spawns a fresh interpreter and re-imports the whole stack. This
+module frames the same newline-delimited JSON-RPC messages over a UNIX
+socket instead, so one long-lived daemon can serve many sessions and the
+per-call cost drops to a socket connect.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import anyio
+import structlog
+
+from mcp import types
+
+try:
+    # mcp >= 1.8 wraps protocol messages in SessionMessage for transport.
+    from mcp.shared.message import SessionMessage
+except ImportError:  # Older mcp releases pass JSONRPCMessage directly.
+    SessionMessage = None
+
+logger = structlog.get_logger(__name__)
+
+
+def _wrap(message: types.JSONRPCMessage):
+    """Wrap a parsed message the way the installed mcp version expects."""
+    return SessionMessage(message) if SessionMessage is not None else message
+
+
+def _to_wire(item) -> bytes:
+    """Serialize an outgoing message to a newline-terminated wire line."""
+    message = item.message if SessionMessage is not None else item
+    payload = message.model_dump_json(by_alias=True, exclude_none=True)
+    return (payload + "\n").encode("utf-8")
+
+
+@asynccontextmanager
+async def socket_streams(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """
+    Bridge an asyncio socket stream pair into MCP read/write streams.
+
+    Yields (read_stream, write_stream) suitable for Server.run or
+    ClientSession, using the same framing as the stdio transport: one
+    JSON-RPC message per newline-terminated UTF-8 line.
+    """
+    read_send, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_recv = anyio.create_memory_object_stream(0)
+
+    async def pump_incoming():
+        """Parse socket lines into protocol messages for the session."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = types.JSONRPCMessage.model_validate_json(line)
+                except Exception as exc:
+                    # Match stdio transport behavior: surface parse errors
+                    # to the session rather than killing the transport.
+                    await read_send.send(exc)
+                    continue
+                await read_send.send(_wrap(message))
+        except (anyio.ClosedResourceError, ConnectionResetError):
+            pass
+        finally:
+            await read_send.aclose()
+
+    async def pump_outgoing():
+        """Write session messages out to the socket."""
+        try:
+            async for item in write_recv:
+                writer.write(_to_wire(item))
+                await writer.drain()
+        except (anyio.ClosedResourceError, ConnectionResetError):
+            pass
+        finally:
+            await write_recv.aclose()
+
+    incoming = asyncio.ensure_future(pump_incoming())
+    outgoing = asyncio.ensure_future(pump_outgoing())
+    try:
+        yield read_stream, write_stream
+    finally:
+        incoming.cancel()
+        outgoing.cancel()
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except (ConnectionResetError, BrokenPipeError):
+            pass
+
+
+@asynccontextmanager
+async def unix_socket_client(path: str):
+    """
+    Connect to a running MCP daemon on a UNIX socket.
+
+    Drop-in alternative to stdio_client: yields (read_stream,
+    write_stream) for a ClientSession without spawning a server process.
+
+    Args:
+        path: Filesystem path of the daemon's listening socket
+    """
+    reader, writer = await asyncio.open_unix_connection(path)
+    async with socket_streams(reader, writer) as streams:
+        yield streams
@@ -13,14 +13,16 @@ logger = structlog.get_logger(__name__)
 class SQLValidator:
     """Validates SQL queries to ensure read-only operations only."""
     
-    # SQL keywords that should be blocked (write operations)
-    BLOCKED_KEYWORDS = {
+    # SQL keywords that should be blocked (write operations).
+    # frozenset: these are probed once per token on the hot path and never
+    # mutated, so make that immutability explicit.
+    BLOCKED_KEYWORDS: frozenset = frozenset({
         'INSERT', 'UPDATE', 'DELETE', 'DROP', 'CREATE', 'ALTER',
         'TRUNCATE', 'GRANT', 'REVOKE', 'EXEC', 'EXECUTE', 'CALL'
-    }
-    
+    })
+
     # Allowed keywords for read operations
-    ALLOWED_KEYWORDS = {
+    ALLOWED_KEYWORDS: frozenset = frozenset({
         'SELECT', 'WITH', 'FROM', 'WHERE', 'JOIN', 'LEFT', 'RIGHT',
         'INNER', 'OUTER', 'ON', 'GROUP', 'BY', 'HAVING', 'ORDER',
         'LIMIT', 'OFFSET', 'UNION', 'INTERSECT', 'EXCEPT', 'AS',
@@ -28,8 +30,26 @@ class SQLValidator:
         'OR', 'NOT', 'IN', 'EXISTS', 'LIKE', 'ILIKE', 'IS', 'NULL',
         'BETWEEN', 'COUNT', 'SUM', 'AVG', 'MAX', 'MIN', 'CAST',
         'COALESCE', 'NULLIF', 'EXTRACT', 'DATE_TRUNC'
-    }
-    
+    })
+
+    # Patterns are compiled once at class-definition time: validation is a
+    # hot path, and going through re.search(str, ...) per call means a
+    # cache lookup (and possible recompile) in re's internal LRU each time.
+    _LINE_COMMENT_RE = re.compile(r'--.*$', flags=re.MULTILINE)
+    _BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', flags=re.DOTALL)
+    _WHITESPACE_RE = re.compile(r'\s+')
+    # Combined alternation of the dangerous patterns from
+    # _detect_sql_injection; searched once per query.
+    _INJECTION_RE = re.compile(
+        r';\s*(?:DROP|DELETE|INSERT|UPDATE)'  # Multiple statements
+        r'|UNION\s+SELECT'  # UNION injection
+        r'|EXEC\s*\('  # Executable code
+        r'|xp_cmdshell'  # SQL Server command execution
+        r'|LOAD_FILE'  # MySQL file loading
+        r'|INTO\s+OUTFILE',  # MySQL file writing
+        flags=re.IGNORECASE,
+    )
+
     @classmethod
     def validate_read_only(cls, query: str) -> Tuple[bool, Optional[str]]:
         """
@@ -43,67 +63,129 @@ class SQLValidator:
         """
         if not query or not query.strip():
             return False, "Empty query"
-        
-        # Normalize query: remove comments and extra whitespace
-        normalized = cls._normalize_query(query)
-        
-        # Check for blocked keywords (case-insensitive)
-        normalized_upper = normalized.upper()
-        for keyword in cls.BLOCKED_KEYWORDS:
-            # Use word boundaries to avoid false positives
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, normalized_upper):
+
+        # Single-pass token scan: the tokenizer itself skips comments and
+        # string literals, so no normalized copy of the query is built and
+        # a keyword inside a literal (WHERE name = 'DROP TABLE') cannot
+        # false-positive. Each identifier costs one frozenset probe.
+        first_token = None
+        for token in cls._tokenize(query):
+            if first_token is None:
+                first_token = token
+                # Basic structure validation - should start with SELECT or WITH
+                if token not in ('SELECT', 'WITH'):
+                    return False, "Query must be a SELECT statement or use WITH clause"
+            if token in cls.BLOCKED_KEYWORDS:
                 logger.warning(
                     "Blocked keyword detected",
-                    keyword=keyword,
+                    keyword=token,
                     query_preview=query[:100]
                 )
-                return False, f"Operation not allowed: {keyword} is not permitted for read-only access"
-        
-        # Basic structure validation - should start with SELECT or WITH
-        normalized_trimmed = normalized.strip().upper()
-        if not (normalized_trimmed.startswith('SELECT') or normalized_trimmed.startswith('WITH')):
+                return False, f"Operation not allowed: {token} is not permitted for read-only access"
+
+        if first_token is None:
+            # Only comments/literals/punctuation - not a SELECT statement
             return False, "Query must be a SELECT statement or use WITH clause"
-        
+
         # Check for potential SQL injection patterns
         if cls._detect_sql_injection(query):
             logger.warning("Potential SQL injection detected", query_preview=query[:100])
             return False, "Query contains potentially dangerous patterns"
-        
+
         return True, None
+
+    @classmethod
+    def _tokenize(cls, sql: str):
+        """
+        Yield uppercased identifier/keyword tokens from `sql` in one pass.
+
+        Walks the string once with a small state machine, skipping
+        '--' comments to end of line, '/* */' blocks and quoted regions
+        (with doubled-quote escapes; E'...' strings additionally honor
+        backslash escapes), and emitting each [A-Za-z_][A-Za-z0-9_]* word
+        it encounters.
+        """
+        i, n = 0, len(sql)
+        # Set when the word just emitted was a bare E/e: a quote directly
+        # after it opens an escape string, where \' does NOT end the
+        # literal. Treating it like a standard string would leave the
+        # scanner inside/outside the literal out of sync with the server
+        # and let keywords hide from the blocked-keyword check.
+        escape_prefix = False
+        while i < n:
+            ch = sql[i]
+            if ch == '-' and sql.startswith('--', i):
+                newline = sql.find('\n', i + 2)
+                i = n if newline == -1 else newline + 1
+            elif ch == '/' and sql.startswith('/*', i):
+                end = sql.find('*/', i + 2)
+                i = n if end == -1 else end + 2
+            elif ch == "'" or ch == '"':
+                quote = ch
+                backslash_escapes = escape_prefix and quote == "'"
+                i += 1
+                while i < n:
+                    if backslash_escapes and sql[i] == '\\':
+                        # Backslash escapes the next character (e.g. \')
+                        i += 2
+                        continue
+                    if sql[i] == quote:
+                        if sql.startswith(quote, i + 1):
+                            # Doubled quote is an escape, not a terminator
+                            i += 2
+                            continue
+                        i += 1
+                        break
+                    i += 1
+            elif ch.isalpha() or ch == '_':
+                start = i
+                i += 1
+                while i < n and (sql[i].isalnum() or sql[i] == '_'):
+                    i += 1
+                word = sql[start:i].upper()
+                yield word
+                escape_prefix = word == 'E' and i < n and sql[i] == "'"
+                continue
+            else:
+                i += 1
+            escape_prefix = False
     
     @classmethod
     def _normalize_query(cls, query: str) -> str:
         """Normalize SQL query by removing comments and extra whitespace."""
         # Remove single-line comments
-        query = re.sub(r'--.*$', '', query, flags=re.MULTILINE)
-        
+        query = cls._LINE_COMMENT_RE.sub('', query)
+
         # Remove multi-line comments
-        query = re.sub(r'/\*.*?\*/', '', query, flags=re.DOTALL)
-        
+        query = cls._BLOCK_COMMENT_RE.sub('', query)
+
         # Normalize whitespace
-        query = re.sub(r'\s+', ' ', query)
-        
+        query = cls._WHITESPACE_RE.sub(' ', query)
+
         return query.strip()
-    
+
     @classmethod
     def _detect_sql_injection(cls, query: str) -> bool:
         """Detect common SQL injection patterns."""
-        dangerous_patterns = [
-            r';\s*(DROP|DELETE|INSERT|UPDATE)',  # Multiple statements
-            r'UNION\s+SELECT',  # UNION injection (though UNION is allowed for valid queries)
-            r'EXEC\s*\(',  # Executable code
-            r'xp_cmdshell',  # SQL Server command execution
-            r'LOAD_FILE',  # MySQL file loading
-            r'INTO\s+OUTFILE',  # MySQL file writing
-        ]
-        
-        normalized = cls._normalize_query(query).upper()
-        for pattern in dangerous_patterns:
-            if re.search(pattern, normalized, re.IGNORECASE):
-                return True
-        
-        return False
+        # Cheap pre-filter: a benign SELECT almost never contains any of
+        # these trigger substrings, so a few C-speed `in` probes skip the
+        # normalization and regex passes entirely on the common path. Each
+        # _INJECTION_RE alternative is covered by at least one trigger.
+        low = query.casefold()
+        if not (
+            ';' in low
+            or 'exec' in low
+            or 'union' in low
+            or 'xp_cmdshell' in low
+            or 'load_file' in low
+            # Bare 'outfile', not 'into outfile': the regex allows any
+            # whitespace between the words, which a literal probe would miss.
+            or 'outfile' in low
+        ):
+            return False
+        # _INJECTION_RE is compiled with IGNORECASE, so no uppercased copy
+        # of the normalized query is needed.
+        return cls._INJECTION_RE.search(cls._normalize_query(query)) is not None
     
     @classmethod
     def sanitize_query(cls, query: str) -> str:
@@ -14,37 +14,35 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from mcp_client import PostgreSQLMCPClient
 
 
-async def example_natural_language_query():
+async def example_natural_language_query(client):
     """Example: Query database using natural language."""
     print("=== Natural Language Query Example ===\n")
     
-    # Use absolute path from project root
-    project_root = Path(__file__).parent.parent
-    client = PostgreSQLMCPClient(["python", str(project_root / "mcp_server.py")])
-    
     questions = [
         "How many tables are in the database?",
         "What are the names of all tables?",
         "Show me the schema of the users table",
     ]
     
-    for question in questions:
+    # The questions are independent LLM calls, so overlap them: wall time
+    # drops from the sum of the latencies to roughly the slowest one.
+    # return_exceptions=True keeps one failure from hiding the others.
+    results = await asyncio.gather(
+        *(client.natural_language_query(question) for question in questions),
+        return_exceptions=True,
+    )
+    for question, result in zip(questions, results):
         print(f"Question: {question}")
-        try:
-            result = await client.natural_language_query(question)
+        if isinstance(result, Exception):
+            print(f"Error: {result}\n")
+        else:
             print(f"Result: {result}\n")
-        except Exception as e:
-            print(f"Error: {e}\n")
 
 
-async def example_sql_query():
+async def example_sql_query(client):
     """Example: Execute direct SQL query."""
     print("=== Direct SQL Query Example ===\n")
     
-    # Use absolute path from project root
-    project_root = Path(__file__).parent.parent
-    client = PostgreSQLMCPClient(["python", str(project_root / "mcp_server.py")])
-    
     queries = [
         "SELECT COUNT(*) as table_count FROM information_schema.tables WHERE table_schema = 'public'",
         "SELECT table_name FROM information_schema.tables WHERE table_schema = 'public' LIMIT 5",
@@ -59,14 +57,10 @@ async def example_sql_query():
             print(f"Error: {e}\n")
 
 
-async def example_list_tables():
+async def example_list_tables(client):
     """Example: List all tables."""
     print("=== List Tables Example ===\n")
     
-    # Use absolute path from project root
-    project_root = Path(__file__).parent.parent
-    client = PostgreSQLMCPClient(["python", str(project_root / "mcp_server.py")])
-    
     try:
         result = await client.list_tables()
         print(f"Tables: {result}\n")
@@ -74,14 +68,10 @@ async def example_list_tables():
         print(f"Error: {e}\n")
 
 
-async def example_describe_table():
+async def example_describe_table(client):
     """Example: Describe table schema."""
     print("=== Describe Table Example ===\n")
     
-    # Use absolute path from project root
-    project_root = Path(__file__).parent.parent
-    client = PostgreSQLMCPClient(["python", str(project_root / "mcp_server.py")])
-    
     # First, get list of tables
     try:
         tables_result = await client.list_tables()
@@ -110,16 +100,22 @@ async def main():
         print("Please set these in your .env file or environment\n")
         return
     
-    # Run examples
-    await example_list_tables()
-    await example_describe_table()
-    await example_sql_query()
+    # One client shared by every example: the server process, MCP
+    # transport and DB pool are started once instead of per call.
+    project_root = Path(__file__).parent.parent
+    client = PostgreSQLMCPClient(["python", str(project_root / "mcp_server.py")])
     
-    # Natural language query requires OpenAI API key
-    if os.getenv("OPENAI_API_KEY"):
-        await example_natural_language_query()
-    else:
-        print("Skipping natural language examples (OPENAI_API_KEY not set)\n")
+    async with client:
+        # Run examples
+        await example_list_tables(client)
+        await example_describe_table(client)
+        await example_sql_query(client)
+        
+        # Natural language query requires OpenAI API key
+        if os.getenv("OPENAI_API_KEY"):
+            await example_natural_language_query(client)
+        else:
+            print("Skipping natural language examples (OPENAI_API_KEY not set)\n")
 
 
 if __name__ == "__main__":
@@ -5,7 +5,9 @@ Creates the database and user if they don't exist, using credentials from .env f
 
 import sys
 import asyncio
+import secrets
 import asyncpg
+from asyncpg.utils import _quote_ident, _quote_literal
 from pathlib import Path
 import structlog
 
@@ -75,40 +77,42 @@ async def init_database():
                 sys.exit(1)
         
         try:
-            # Check if user exists, create if not
-            logger.info("Checking if user exists", user=user)
-            user_exists = await conn.fetchval(
-                "SELECT 1 FROM pg_roles WHERE rolname = $1",
-                user
-            )
-            
-            # Drop user if exists to ensure clean creation with correct password
-            if user_exists:
-                logger.info("User already exists, dropping to recreate with correct password", user=user)
-                try:
-                    # Drop the user (CASCADE to handle any dependencies)
-                    await conn.execute(f'DROP USER IF EXISTS "{user}" CASCADE')
-                    logger.info("Old user dropped", user=user)
-                except Exception as e:
-                    logger.warning("Could not drop existing user, will try to update password", error=str(e))
-            
-            # Create user with password
-            # Note: CREATE USER doesn't support parameterized queries, so we need to escape the password
-            # We'll use asyncpg's connection.escape_string() equivalent approach
-            logger.info("Creating user", user=user)
+            # DDL cannot be parameterized, so quote with asyncpg's own
+            # helpers instead of ad-hoc escaping: _quote_ident for
+            # identifiers, _quote_literal for the name/password literals
+            # fed to format(), which quotes server-side (%I / %L).
+            user_lit = _quote_literal(user)
+            user_ident = _quote_ident(user)
+            db_ident = _quote_ident(db_name)
             
-            # Properly escape the password for SQL
-            # Replace single quotes with doubled single quotes for SQL escaping
-            escaped_password = password.replace("'", "''")
-            # Also escape backslashes
-            escaped_password = escaped_password.replace("\\", "\\\\")
-            
-            await conn.execute(
-                f'CREATE USER "{user}" WITH PASSWORD \'{escaped_password}\''
-            )
+            # Drop/recreate the role in one anonymous block: a single
+            # round-trip replaces the exists-probe, DROP and CREATE USER
+            # statements, and the password never needs Python-side escaping.
+            #
+            # The dollar-quote tag is randomized (and re-rolled on the
+            # astronomically unlikely collision) so that a password or
+            # user name containing a fixed tag like $do$ cannot terminate
+            # the quoted body early and run as top-level SQL.
+            logger.info("Recreating user with password from .env", user=user)
+            body = f"""
+                BEGIN
+                    IF EXISTS (SELECT 1 FROM pg_roles WHERE rolname = {user_lit}) THEN
+                        -- Recreate so the password always matches .env
+                        EXECUTE format('DROP USER %I', {user_lit});
+                    END IF;
+                    EXECUTE format('CREATE USER %I WITH PASSWORD %L',
+                                   {user_lit}, {_quote_literal(password)});
+                END
+            """
+            tag = f"$do_{secrets.token_hex(8)}$"
+            while tag in body:
+                tag = f"$do_{secrets.token_hex(8)}$"
+            await conn.execute(f"DO {tag}{body}{tag}")
             logger.info("User created successfully", user=user)
             
-            # Check if database exists, create if not
+            # Check if database exists, create if not. CREATE DATABASE
+            # cannot run inside the DO block's implicit transaction, so it
+            # stays a separate statement.
             logger.info("Checking if database exists", database=db_name)
             db_exists = await conn.fetchval(
                 "SELECT 1 FROM pg_database WHERE datname = $1",
@@ -117,7 +121,7 @@ async def init_database():
             
             if not db_exists:
                 logger.info("Creating database", database=db_name)
-                await conn.execute(f'CREATE DATABASE "{db_name}"')
+                await conn.execute(f'CREATE DATABASE {db_ident}')
                 logger.info("Database created successfully", database=db_name)
             else:
                 logger.info("Database already exists", database=db_name)
@@ -127,7 +131,7 @@ async def init_database():
             try:
                 # Grant all privileges on the database to the user (use quoted identifiers)
                 await conn.execute(
-                    f'GRANT ALL PRIVILEGES ON DATABASE "{db_name}" TO "{user}"'
+                    f'GRANT ALL PRIVILEGES ON DATABASE {db_ident} TO {user_ident}'
                 )
                 
                 # Connect to the new database to grant schema privileges
@@ -135,17 +139,17 @@ async def init_database():
                 conn = await asyncpg.connect(
                     host=host,
                     port=port,
-                    user=default_user,
+                    user=superuser,
                     password=superuser_password,
                     database=db_name
                 )
                 
                 # Grant privileges on the public schema (use quoted identifiers)
-                await conn.execute(f'GRANT ALL ON SCHEMA public TO "{user}"')
-                await conn.execute(f'GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO "{user}"')
-                await conn.execute(f'GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO "{user}"')
-                await conn.execute(f'ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON TABLES TO "{user}"')
-                await conn.execute(f'ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON SEQUENCES TO "{user}"')
+                await conn.execute(f'GRANT ALL ON SCHEMA public TO {user_ident}')
+                await conn.execute(f'GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO {user_ident}')
+                await conn.execute(f'GRANT ALL PRIVILEGES ON ALL SEQUENCES IN SCHEMA public TO {user_ident}')
+                await conn.execute(f'ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON TABLES TO {user_ident}')
+                await conn.execute(f'ALTER DEFAULT PRIVILEGES IN SCHEMA public GRANT ALL ON SEQUENCES TO {user_ident}')
                 
                 logger.info("Privileges granted successfully")
             except Exception as e:
@@ -29,7 +29,7 @@ async def test_connection(host, port, user, password, database="postgres"):
             user=user,
             password=password,
             database=database,
-            timeout=5
+            timeout=2
         )
         await conn.close()
         return True, None
@@ -53,40 +53,47 @@ async def main():
     port = settings.postgres_port
     password = settings.postgres_password
     
+    # The probes are independent and I/O-bound, so run them concurrently:
+    # a fully broken setup waits one timeout instead of one per probe.
+    (
+        (superuser_ok, superuser_error),
+        (user_ok, user_error),
+        (db_ok, db_error),
+    ) = await asyncio.gather(
+        test_connection(host, port, "postgres", password),
+        test_connection(host, port, settings.postgres_user, password),
+        test_connection(host, port, "postgres", password, settings.postgres_db),
+    )
+    
     # Test 1: Connect as postgres superuser
     print("Test 1: Connecting as 'postgres' superuser...")
-    success, error = await test_connection(host, port, "postgres", password)
-    if success:
+    if superuser_ok:
         print("✓ Successfully connected as 'postgres' superuser")
     else:
-        print(f"✗ Failed: {error}")
+        print(f"✗ Failed: {superuser_error}")
     print()
     
     # Test 2: Connect as target user
     print(f"Test 2: Connecting as '{settings.postgres_user}' user...")
-    success, error = await test_connection(host, port, settings.postgres_user, password)
-    if success:
+    if user_ok:
         print(f"✓ Successfully connected as '{settings.postgres_user}'")
     else:
-        print(f"✗ Failed: {error}")
+        print(f"✗ Failed: {user_error}")
     print()
     
     # Test 3: Connect to target database as postgres
     print(f"Test 3: Connecting to database '{settings.postgres_db}' as 'postgres'...")
-    success, error = await test_connection(host, port, "postgres", password, settings.postgres_db)
-    if success:
+    if db_ok:
         print(f"✓ Successfully connected to '{settings.postgres_db}' as 'postgres'")
     else:
-        print(f"✗ Failed: {error}")
+        print(f"✗ Failed: {db_error}")
     print()
     
-    # Recommendations
+    # Recommendations (reuse the results above instead of reconnecting)
     print("Recommendations:")
     print("-" * 50)
     
-    # Check if postgres connection works
-    success, _ = await test_connection(host, port, "postgres", password)
-    if not success:
+    if not superuser_ok:
         print("⚠️  Cannot connect as 'postgres' superuser.")
         print("   This usually means:")
         print("   1. The PostgreSQL volume was initialized with a different password")
@@ -98,8 +105,7 @@ async def main():
         print("      sleep 10")
         print("      python scripts/init_db.py")
     else:
-        success, _ = await test_connection(host, port, settings.postgres_user, password)
-        if not success:
+        if not user_ok:
             print("✓ Can connect as 'postgres' superuser")
             print("⚠️  Cannot connect as target user (this is expected before initialization)")
             print("   Run the initialization script:")
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Add project root to path so `postgresql_mcp` imports without installation
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,91 @@
+"""
+Regression tests for the read-only SQL validator.
+
+The tokenizer is a security control: if it loses track of where a string
+literal ends, write keywords can hide inside what it thinks is a literal.
+These tests pin down the quoting edge cases, PostgreSQL E-strings in
+particular.
+"""
+
+from postgresql_mcp.sql_validator import SQLValidator
+
+
+def tokens(sql):
+    return list(SQLValidator._tokenize(sql))
+
+
+class TestValidateReadOnly:
+    def test_plain_select_allowed(self):
+        is_valid, error = SQLValidator.validate_read_only(
+            "SELECT id, name FROM users WHERE id = 1"
+        )
+        assert is_valid
+        assert error is None
+
+    def test_with_cte_allowed(self):
+        is_valid, _ = SQLValidator.validate_read_only(
+            "WITH a AS (SELECT 1 AS x) SELECT * FROM a"
+        )
+        assert is_valid
+
+    def test_write_statement_blocked(self):
+        is_valid, error = SQLValidator.validate_read_only("DELETE FROM users")
+        assert not is_valid
+        assert "SELECT" in error
+
+    def test_blocked_keyword_in_cte(self):
+        is_valid, _ = SQLValidator.validate_read_only(
+            "WITH d AS (DELETE FROM users RETURNING 1) SELECT * FROM d"
+        )
+        assert not is_valid
+
+    def test_empty_query_rejected(self):
+        assert not SQLValidator.validate_read_only("   ")[0]
+
+    def test_keyword_inside_literal_is_not_blocked(self):
+        is_valid, _ = SQLValidator.validate_read_only(
+            "SELECT * FROM logs WHERE message = 'DROP TABLE users'"
+        )
+        assert is_valid
+
+
+class TestQuotingEdgeCases:
+    def test_doubled_quote_escape(self):
+        # '' inside a standard string is an escaped quote, not a terminator
+        assert tokens("SELECT 'it''s' AS x") == ['SELECT', 'AS', 'X']
+
+    def test_quoted_identifier(self):
+        assert tokens('SELECT "weird name" FROM t') == ['SELECT', 'FROM', 'T']
+
+    def test_escape_string_backslash_quote_ends_literal(self):
+        # In E'\'' the backslash escapes the quote; the literal ends at
+        # the final quote, so FROM must still be visible to the scanner.
+        assert tokens("SELECT E'\\'' , x FROM t") == ['SELECT', 'E', 'X', 'FROM', 'T']
+
+    def test_escape_string_cannot_hide_delete(self):
+        # Regression: the doubled-quote rule alone treated the '' in E'\''
+        # as an escape and swallowed the rest of the query, letting a
+        # data-modifying CTE through the validator.
+        is_valid, _ = SQLValidator.validate_read_only(
+            "WITH a AS (SELECT E'\\'' AS x), "
+            "d AS (DELETE FROM users RETURNING 1) SELECT * FROM d"
+        )
+        assert not is_valid
+
+    def test_escape_string_escaped_backslash(self):
+        # E'\\' is a literal backslash; the string ends at the next quote
+        assert tokens("SELECT E'\\\\' AS x FROM t") == ['SELECT', 'E', 'AS', 'X', 'FROM', 'T']
+
+    def test_uppercase_and_lowercase_escape_prefix(self):
+        assert 'DELETE' in tokens("SELECT e'\\'' AS x, (DELETE) FROM t".upper())
+        assert 'FROM' in tokens("select e'\\'', col from t")
+
+    def test_e_identifier_is_not_an_escape_prefix(self):
+        # A column named e followed by a separate string must not switch
+        # the next literal into escape mode.
+        assert tokens("SELECT e, '\\' , secret FROM t") == ['SELECT', 'E', 'SECRET', 'FROM', 'T']
+
+    def test_comments_are_skipped(self):
+        sql = "SELECT 1 -- DELETE FROM users\n, 2 /* DROP TABLE t */ FROM x"
+        assert tokens(sql) == ['SELECT', 'FROM', 'X']
+        assert SQLValidator.validate_read_only(sql)[0]